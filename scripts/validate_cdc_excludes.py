@@ -7,11 +7,12 @@ and validates that GoldenGate extract configurations include required COLEXC
 statements for fields that should be excluded from CDC.
 
 Requirements:
-- databricks-sql-connector
+- databricks-sql-connector (with pyarrow)
+- orjson (optional, used for faster parsing of extracts.json when installed)
 - Environment variables: DATABRICKS_SERVER_HOSTNAME, DATABRICKS_HTTP_PATH, DATABRICKS_ACCESS_TOKEN
 
 Usage:
-    python validate_cdc_excludes.py [--config-path CONFIG_PATH] [--environment ENV]
+    python validate_cdc_excludes.py [--config-path CONFIG_PATH [CONFIG_PATH ...]] [--environment ENV] [--fail-fast]
 """
 
 import json
@@ -19,9 +20,54 @@ import os
 import sys
 import argparse
 import re
-from typing import Dict, List, Set, Tuple
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 from databricks import sql
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Regex patterns are compiled once at import time; they are applied to every
+# string node in the extract config and every TABLE statement found there.
+# TABLE names and COLEXC tokens are matched against upper-cased text, so those
+# patterns are case-sensitive.
+_TABLE_STMT_RE = re.compile(r'TABLE\s+[\w\.\*]+[^\n]*', re.IGNORECASE | re.MULTILINE)
+_TABLE_NAME_RE = re.compile(r'TABLE\s+([\w\.]+)')
+# The token is captured inside a lookahead so it is not consumed: a token that
+# is itself (or ends in) COLEXC can still start the next match, as it could
+# when each field was searched for separately.
+_COLEXC_TOKEN_RE = re.compile(r'COLEXC\s+(?=([^,\s]*))')
+
+
+def _colexc_tokens(config_text: str) -> Set[str]:
+    """
+    Return the tokens following each COLEXC keyword in upper-cased config text
+    
+    A required field is covered when it appears within one of these tokens.
+    Repeated keywords do not hide the token after them:
+    
+    >>> sorted(_colexc_tokens('COLEXC COLEXC SSN'))
+    ['COLEXC', 'SSN']
+    >>> sorted(_colexc_tokens('XCOLEXC  COLEXC\\nDOB, COLEXC EMAIL_ADDR;'))
+    ['COLEXC', 'DOB', 'EMAIL_ADDR;']
+    >>> _colexc_tokens('TABLE SCHEMA.TABLE_NAME;')
+    set()
+    """
+    if 'COLEXC' not in config_text:
+        return set()
+    return set(_COLEXC_TOKEN_RE.findall(config_text))
+
+
+# Number of rows pulled from Databricks per fetch round trip
+_FETCH_BATCH_SIZE = 10000
+
 
 class CDCValidationError(Exception):
     """Custom exception for CDC validation failures"""
@@ -41,8 +87,24 @@ class CDCExcludeValidator:
         self.databricks_hostname = databricks_hostname
         self.databricks_http_path = databricks_http_path
         self.databricks_token = databricks_token
-        self.exclude_fields = {}  # Will store {table_name: [field_names]}
+        self.exclude_fields = {}  # Will store {table_name: frozenset(field_names)}
+        self._log = []  # Progress lines buffered until the end of each phase
+        self._log_lock = threading.Lock()  # Config files may be loaded on worker threads
         
+    def _log_line(self, message: str):
+        """Buffer a progress line for the current phase"""
+        self._log.append(message)
+    
+    def _log_lines(self, messages: Iterable[str]):
+        """Buffer several progress lines for the current phase"""
+        self._log.extend(messages)
+    
+    def _flush_log(self):
+        """Write all buffered progress lines to stdout in a single call"""
+        if self._log:
+            sys.stdout.write('\n'.join(self._log) + '\n')
+            self._log.clear()
+    
     def connect_to_databricks(self):
         """Establish connection to Databricks"""
         try:
@@ -57,41 +119,71 @@ class CDCExcludeValidator:
             print(f"❌ Failed to connect to Databricks: {str(e)}")
             return False
     
-    def get_exclude_fields(self) -> Dict[str, List[str]]:
+    def get_exclude_fields(self, table_names: Optional[Set[str]] = None) -> Dict[str, FrozenSet[str]]:
         """
         Query Databricks for fields that should be excluded from CDC
         
+        Args:
+            table_names: Upper-cased table names to restrict the query to.
+                If None, exclude fields for every table are retrieved.
+        
         Returns:
-            Dictionary mapping table names to list of field names to exclude
+            Dictionary mapping table names to the set of field names to exclude
         """
         query = """
         SELECT 
             table_name,
             field_name
         FROM cdc_field_exclude_list
-        WHERE active = true
+        WHERE active = true{table_filter}
         ORDER BY table_name, field_name
         """
+        parameters = None
+        
+        if table_names is not None:
+            if not table_names:
+                print("ℹ️  No table names to look up, skipping cdc_field_exclude_list query")
+                self.exclude_fields = {}
+                return {}
+            parameters = sorted(table_names)
+            placeholders = ', '.join('?' for _ in parameters)
+            query = query.format(table_filter=f"\n          AND UPPER(table_name) IN ({placeholders})")
+        else:
+            query = query.format(table_filter="")
         
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
+            # arraysize is read by execute() as the size of the first batch
+            cursor = self.connection.cursor(arraysize=_FETCH_BATCH_SIZE)
+            cursor.execute(query, parameters=parameters)
             
-            # Group results by table name
+            # Group results by table name, one Arrow batch at a time. Reading
+            # whole columns avoids building a Python tuple for every row.
             exclude_map = {}
-            for row in results:
-                table_name = row[0].upper()  # Convert to uppercase for matching
-                field_name = row[1].upper()  # Convert to uppercase for matching
-                
-                if table_name not in exclude_map:
-                    exclude_map[table_name] = []
-                exclude_map[table_name].append(field_name)
+            # Raw name -> interned upper-cased name. The same table and field
+            # names repeat across many rows, so each is upper-cased only once
+            # and all rows share a single string object.
+            upper_names = {}
+            while True:
+                batch = cursor.fetchmany_arrow(_FETCH_BATCH_SIZE)
+                if batch.num_rows == 0:
+                    break
+                for table_name, field_name in zip(batch.column('table_name').to_pylist(),
+                                                  batch.column('field_name').to_pylist()):
+                    # Convert to uppercase for matching
+                    table_upper = upper_names.get(table_name)
+                    if table_upper is None:
+                        table_upper = upper_names[table_name] = sys.intern(table_name.upper())
+                    field_upper = upper_names.get(field_name)
+                    if field_upper is None:
+                        field_upper = upper_names[field_name] = sys.intern(field_name.upper())
+                    exclude_map.setdefault(table_upper, set()).add(field_upper)
+            cursor.close()
+            
+            exclude_map = {table: frozenset(fields) for table, fields in exclude_map.items()}
             
-            print(f"✅ Retrieved exclude fields for {len(exclude_map)} tables")
-            for table, fields in exclude_map.items():
-                print(f"   {table}: {', '.join(fields)}")
+            self._log_line(f"✅ Retrieved exclude fields for {len(exclude_map)} tables")
+            self._log_lines(f"   {table}: {', '.join(sorted(fields))}" for table, fields in exclude_map.items())
+            self._flush_log()
             
             self.exclude_fields = exclude_map
             return exclude_map
@@ -110,13 +202,14 @@ class CDCExcludeValidator:
             Parsed JSON configuration
         """
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            print(f"✅ Successfully parsed extract configuration: {config_path}")
+            # Both decoders accept raw bytes, which skips a separate text decode
+            with open(config_path, 'rb') as f:
+                config = _json_loads(f.read())
             return config
         except FileNotFoundError:
             raise CDCValidationError(f"Configuration file not found: {config_path}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
             raise CDCValidationError(f"Invalid JSON in configuration file: {str(e)}")
     
     def extract_table_configs(self, extract_config: Dict) -> List[Tuple[str, str, str]]:
@@ -127,7 +220,8 @@ class CDCExcludeValidator:
             extract_config: Parsed extract configuration
             
         Returns:
-            List of tuples: (extract_name, table_statement, full_config_text)
+            List of tuples: (extract_name, table_statement, full_config_text),
+            where full_config_text is upper-cased
         """
         table_configs = []
         
@@ -150,98 +244,165 @@ class CDCExcludeValidator:
                     config_sections.extend(extract['config']['parameters'])
             
             # Check for TABLE statements in any string values within config
-            def find_table_statements(obj, prefix=""):
-                if isinstance(obj, str):
-                    # Look for TABLE statements in the string
-                    table_pattern = r'TABLE\s+[\w\.\*]+[^\n]*'
-                    matches = re.finditer(table_pattern, obj, re.IGNORECASE | re.MULTILINE)
-                    for match in matches:
-                        table_statement = match.group(0).strip()
-                        table_configs.append((extract_name, table_statement, obj))
-                elif isinstance(obj, dict):
-                    for key, value in obj.items():
-                        find_table_statements(value, f"{prefix}.{key}" if prefix else key)
-                elif isinstance(obj, list):
-                    for i, item in enumerate(obj):
-                        find_table_statements(item, f"{prefix}[{i}]" if prefix else f"[{i}]")
+            self._find_table_statements(extract.get('config', {}), extract_name, table_configs)
+        
+        return table_configs
+    
+    def _find_table_statements(self, obj, extract_name: str, out: List[Tuple[str, str, str]],
+                               _table_stmt_re=_TABLE_STMT_RE):
+        """
+        Collect TABLE statements from every string value nested within obj
+        
+        The config is walked with an explicit stack; children are pushed in
+        reverse so statements are reported in document order. The regex is
+        bound as a default argument so the loop only touches locals.
+        
+        Args:
+            obj: Extract config value (string, dict or list) to search
+            extract_name: Name of the extract the config belongs to
+            out: List that (extract_name, table_statement, full_config_text)
+                tuples are appended to
+        """
+        stack = deque([obj])
+        while stack:
+            obj = stack.pop()
+            obj_type = type(obj)
+            if obj_type is str:
+                # Look for TABLE statements in the string; the string is
+                # upper-cased only once a statement matches, and that copy
+                # is shared by all of its statements
+                obj_upper = None
+                for match in _table_stmt_re.finditer(obj):
+                    if obj_upper is None:
+                        obj_upper = obj.upper()
+                    table_statement = match.group(0).strip()
+                    out.append((extract_name, table_statement, obj_upper))
+            elif obj_type is dict:
+                stack.extend(reversed(obj.values()))
+            elif obj_type is list:
+                stack.extend(reversed(obj))
+    
+    def load_table_configs(self, config_path: str) -> List[Tuple[str, str, str]]:
+        """
+        Parse an extracts.json file and extract its TABLE configurations
+        
+        Progress for the file is written as a single block, so output from
+        files loaded concurrently does not interleave.
+        
+        Args:
+            config_path: Path to the extracts.json file
             
-            # Search through the entire config
-            find_table_statements(extract.get('config', {}))
+        Returns:
+            List of tuples: (extract_name, table_statement, full_config_text)
+        """
+        table_configs = self.extract_table_configs(self.parse_extract_config(config_path))
         
-        print(f"✅ Found {len(table_configs)} TABLE statements across all extracts")
-        for extract_name, table_stmt, _ in table_configs:
-            print(f"   {extract_name}: {table_stmt[:60]}{'...' if len(table_stmt) > 60 else ''}")
+        with self._log_lock:
+            self._log_line(f"✅ Successfully parsed extract configuration: {config_path}")
+            self._log_line(f"✅ Found {len(table_configs)} TABLE statements in {config_path}")
+            self._log_lines(
+                f"   {extract_name}: {table_stmt[:60]}{'...' if len(table_stmt) > 60 else ''}"
+                for extract_name, table_stmt, _ in table_configs
+            )
+            self._flush_log()
         
         return table_configs
     
-    def extract_table_name(self, table_statement: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def extract_table_name(table_statement: str) -> str:
         """
         Extract the actual table name from a TABLE statement
         
+        Results are cached, since the same statement is looked up when
+        building the Databricks query and again during validation, and
+        often repeats across extracts.
+        
+        Statements starting with the TABLE keyword followed by a plain
+        table reference are parsed without a regex, e.g.:
+            TABLE SCHEMA.TABLE_NAME;
+            TABLE TABLE_NAME, COLEXCEPT (FIELD);
+            TABLE SCHEMA.TABLE_NAME COLEXC FIELD
+        Anything else (wildcards, quoted names, leading text) falls back to
+        a regex search.
+        
         Args:
             table_statement: The TABLE statement string
             
         Returns:
             The table name (without schema prefix if present)
         """
+        table_statement = table_statement.upper()
+        
+        # Fast path: take the token after TABLE up to any ';' or ','
+        parts = table_statement.split(None, 2)
+        if len(parts) >= 2 and parts[0] == 'TABLE':
+            table_ref = parts[1].split(';', 1)[0].split(',', 1)[0]
+            if table_ref.replace('.', '').replace('_', '').isalnum():
+                # If there's a schema prefix, get just the table name
+                return table_ref.rpartition('.')[2]
+        
         # Pattern to match TABLE statement and extract table name
         # Handles cases like: TABLE SCHEMA.TABLE_NAME, TABLE TABLE_NAME, etc.
-        pattern = r'TABLE\s+([\w\.]+)'
-        match = re.search(pattern, table_statement, re.IGNORECASE)
+        match = _TABLE_NAME_RE.search(table_statement)
         
         if match:
             table_ref = match.group(1)
             # If there's a schema prefix, get just the table name
-            if '.' in table_ref:
-                table_name = table_ref.split('.')[-1]
-            else:
-                table_name = table_ref
-            return table_name.upper()
+            return table_ref.rpartition('.')[2]
         
         return ""
     
-    def validate_colexc_statements(self, table_configs: List[Tuple[str, str, str]]) -> List[str]:
+    def iter_validate(self, table_configs: List[Tuple[str, str, str]]) -> Iterator[Tuple[str, str]]:
         """
         Validate that required COLEXC statements are present
         
+        Results are yielded as they are produced, so callers can report
+        progress as it happens and stop at the first error.
+        
         Args:
             table_configs: List of table configurations to validate
             
-        Returns:
-            List of validation errors
+        Yields:
+            Tuples of (kind, message), where kind is 'info' for progress,
+            'ok' for a table that passed and 'err' for a validation error
         """
-        errors = []
+        # COLEXC tokens per config string, keyed by id(); a config string
+        # containing several TABLE statements is only scanned once
+        scanned = {}
         
         for extract_name, table_statement, full_config in table_configs:
             table_name = self.extract_table_name(table_statement)
             
             if not table_name:
-                errors.append(f"❌ {extract_name}: Could not extract table name from: {table_statement}")
+                yield 'err', f"❌ {extract_name}: Could not extract table name from: {table_statement}"
                 continue
             
             # Check if this table has required exclude fields
             if table_name in self.exclude_fields:
-                required_fields = self.exclude_fields[table_name]
-                print(f"🔍 Validating {extract_name}: {table_name} (requires COLEXC for: {', '.join(required_fields)})")
+                required_fields = sorted(self.exclude_fields[table_name])
+                yield 'info', f"🔍 Validating {extract_name}: {table_name} (requires COLEXC for: {', '.join(required_fields)})"
                 
-                # Check if COLEXC statements are present for required fields
-                missing_colexc = []
-                for field in required_fields:
-                    # Look for COLEXC statement with this field
-                    colexc_pattern = rf'COLEXC\s+[^,\s]*{re.escape(field)}[^,\s]*'
-                    if not re.search(colexc_pattern, full_config, re.IGNORECASE):
-                        missing_colexc.append(field)
+                # Collect every COLEXC token in the config. A single token may
+                # cover several fields, so membership is checked per field
+                # against the matched tokens.
+                colexc_tokens = scanned.get(id(full_config))
+                if colexc_tokens is None:
+                    colexc_tokens = _colexc_tokens(full_config)
+                    scanned[id(full_config)] = colexc_tokens
+                missing_colexc = [
+                    field for field in required_fields
+                    if not any(field in token for token in colexc_tokens)
+                ]
                 
                 if missing_colexc:
-                    errors.append(
+                    yield 'err', (
                         f"❌ {extract_name}: Table {table_name} missing COLEXC for fields: {', '.join(missing_colexc)}"
                     )
                 else:
-                    print(f"✅ {extract_name}: Table {table_name} has all required COLEXC statements")
+                    yield 'ok', f"✅ {extract_name}: Table {table_name} has all required COLEXC statements"
             else:
-                print(f"ℹ️  {extract_name}: Table {table_name} has no exclude field requirements")
-        
-        return errors
+                yield 'info', f"ℹ️  {extract_name}: Table {table_name} has no exclude field requirements"
     
     def close_connection(self):
         """Close Databricks connection"""
@@ -253,11 +414,15 @@ class CDCExcludeValidator:
 def main():
     parser = argparse.ArgumentParser(description='Validate CDC field excludes in GoldenGate configuration')
     parser.add_argument('--config-path', 
-                       default='../config/extracts.json',
-                       help='Path to extracts.json configuration file')
+                       nargs='+',
+                       default=['../config/extracts.json'],
+                       help='Path(s) to extracts.json configuration files')
     parser.add_argument('--environment',
                        default=os.getenv('TARGET_ENV', 'dev'),
                        help='Target environment for validation')
+    parser.add_argument('--fail-fast',
+                       action='store_true',
+                       help='Stop validating at the first error')
     
     args = parser.parse_args()
     
@@ -274,7 +439,7 @@ def main():
         sys.exit(1)
     
     print(f"🚀 Starting CDC field exclude validation for environment: {args.environment}")
-    print(f"📁 Configuration file: {args.config_path}")
+    print(f"📁 Configuration file(s): {', '.join(args.config_path)}")
     print(f"🔗 Databricks hostname: {databricks_hostname}")
     
     validator = CDCExcludeValidator(
@@ -288,21 +453,35 @@ def main():
         if not validator.connect_to_databricks():
             sys.exit(1)
         
-        # Get exclude fields from Databricks
-        validator.get_exclude_fields()
-        
-        # Parse extract configuration
-        extract_config = validator.parse_extract_config(args.config_path)
-        
-        # Extract table configurations
-        table_configs = validator.extract_table_configs(extract_config)
+        # Parse extract configurations and extract their table configurations;
+        # files are independent, so they are loaded concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(args.config_path))) as executor:
+            table_configs = [
+                table_config
+                for file_configs in executor.map(validator.load_table_configs, args.config_path)
+                for table_config in file_configs
+            ]
+        print(f"✅ Found {len(table_configs)} TABLE statements across {len(args.config_path)} configuration file(s)")
         
         if not table_configs:
             print("⚠️  No TABLE statements found in extract configuration")
             return
         
-        # Validate COLEXC statements
-        errors = validator.validate_colexc_statements(table_configs)
+        # Get exclude fields from Databricks, only for tables referenced by the extracts
+        needed_tables = {validator.extract_table_name(table_stmt) for _, table_stmt, _ in table_configs}
+        needed_tables.discard("")
+        validator.get_exclude_fields(needed_tables)
+        
+        # Validate COLEXC statements, printing progress as it is produced
+        errors = []
+        for kind, message in validator.iter_validate(table_configs):
+            if kind == 'err':
+                errors.append(message)
+                if args.fail_fast:
+                    print("⏹️  Stopping at first error (--fail-fast)")
+                    break
+            else:
+                print(message)
         
         if errors:
             print("\n❌ CDC Field Exclude Validation FAILED:")